@@ -58,13 +58,10 @@ impl Problem<Hello> for World {
     fn empty() -> Self { World::new() }
 
     fn solve(&self, model: &mut Hello) -> f32 {
-        let mut total = 0.0;
-        for (index, letter) in self.target.iter().enumerate() {
-            if letter == &model.data[index] {
-                total += 1.0;
-            }
-        }
-        total        
+        self.target.iter()
+            .zip(model.data.iter())
+            .filter(|(one, two)| one == two)
+            .count() as f32
     }
 }
 
@@ -103,11 +100,7 @@ impl Hello {
     }
 
     pub fn as_string(&self) -> String {
-        self.data
-            .iter()
-            .map(|x| String::from(x.to_string()))
-            .collect::<Vec<_>>()
-            .join("")
+        self.data.iter().collect()
     }
 }
 
@@ -118,32 +111,26 @@ impl Genome<Hello, HelloEnv> for Hello {
     fn crossover(parent_one: &Hello, parent_two: &Hello, env: Arc<RwLock<HelloEnv>>, crossover_rate: f32) -> Option<Hello> {
         let params = env.read().unwrap();
         let mut r = rand::thread_rng();
-        let mut new_data = Vec::new();
-        
-        if r.gen::<f32>() < crossover_rate {
-            for (one, two) in parent_one.data.iter().zip(parent_two.data.iter()) {
-                if one != two {
-                    new_data.push(*one);
-                } else {
-                    new_data.push(*two);
-                }
-            }
+        let new_data = if r.gen::<f32>() < crossover_rate {
+            parent_one.data.iter()
+                .zip(parent_two.data.iter())
+                .map(|(one, two)| if one != two { *one } else { *two })
+                .collect()
         } else {
-            new_data = parent_one.data.clone();
+            let mut new_data = parent_one.data.clone();
             let swap_index = r.gen_range(0, new_data.len());
             new_data[swap_index] = params.alph[r.gen_range(0, params.alph.len())];
-        }
+            new_data
+        };
         Some(Hello { data: new_data })
     }
 
 
     fn distance(one: &Hello, two: &Hello, _: Arc<RwLock<HelloEnv>>) -> f32 {
-        let mut total = 0_f32;
-        for (i, j) in one.data.iter().zip(two.data.iter()) {
-            if i == j {
-                total += 1_f32;
-            }
-        }
+        let total = one.data.iter()
+            .zip(two.data.iter())
+            .filter(|(i, j)| i == j)
+            .count() as f32;
         one.data.len() as f32 / total
     }
 
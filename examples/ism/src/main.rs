@@ -1,16 +1,12 @@
 
 extern crate radiate;
 extern crate csv;
-extern crate rayon;
 
 use std::error::Error;
 use radiate::prelude::*;
 
 fn main() -> Result<(), Box<dyn Error>> {
 
-    // set the number of threads to be used
-    rayon::ThreadPoolBuilder::new().num_threads(8).build_global().unwrap();
-
     // define the environment
     let neat_env = NeatEnvironment::new()
         .set_weight_mutate_rate(0.8)
@@ -222,7 +218,7 @@ impl Problem<Neat> for ISM {
         let mut total = 0.0;
         for (ins, outs) in self.inputs.iter().zip(self.answers.iter()) {
             match model.forward(&ins) {
-                Some(guess) => total += (guess[0] - outs[0]).powf(2.0),
+                Some(guess) => total += (guess[0] - outs[0]) * (guess[0] - outs[0]),
                 None => panic!("Error in training NEAT")
             }
         }
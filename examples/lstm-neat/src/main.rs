@@ -125,7 +125,7 @@ impl Problem<Neat> for MemoryTest {
         let mut total = 0.0;
         for (ins, outs) in self.input.iter().zip(self.output.iter()) {
             match model.forward(&ins) {
-                Some(guess) => total += (guess[0] - outs[0]).powf(2.0),
+                Some(guess) => total += (guess[0] - outs[0]) * (guess[0] - outs[0]),
                 None => panic!("Error in training NEAT")
             }
         }
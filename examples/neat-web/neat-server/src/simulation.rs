@@ -69,7 +69,7 @@ impl Problem<Neat> for TrainingSet {
         let mut total = 0.0;
         for (ins, outs) in self.inputs.iter().zip(self.answers.iter()) {
             match model.forward(&ins) {
-                Some(guess) => total += (guess[0] - outs[0]).powf(2.0),
+                Some(guess) => total += (guess[0] - outs[0]) * (guess[0] - outs[0]),
                 None => panic!("Error in training NEAT")
             }
         }
@@ -105,15 +105,16 @@ impl<T, E> Generation<T, E>
         }
     }
 
-    /// pass down the previous generation's members and species to a new generation
+    /// pass down the previous generation's members and species to a new generation.
+    /// Wrapping the members is just a move per member, so it isn't worth sending to rayon
     #[inline]
     pub fn pass_down(&self, new_members: Vec<Member<T>>) -> Option<Self> {
         Some(Generation {
             members: new_members
-                .into_par_iter()
-                .map(|x| {
+                .into_iter()
+                .map(|member| {
                     Container {
-                        member: Arc::clone(&x),
+                        member,
                         fitness_score: 0.0,
                         species: None
                     }
@@ -151,11 +152,15 @@ impl<T, E> Generation<T, E>
     pub fn optimize<P>(&mut self, prob: Arc<RwLock<P>>)
         where P: Problem<T> + Send + Sync
     {
-        // concurrently iterate the members and optimize them
+        // concurrently iterate the members and optimize them. The problem is only read while the
+        // members are solved, so take the read lock once and share it instead of every member
+        // hitting the lock's shared counter from every thread
+        let problem = prob.read().unwrap();
+        let problem = &*problem;
         self.members
             .par_iter_mut()
-            .for_each_with(prob, |problem, cont| {
-                (*cont).fitness_score = problem.read().unwrap().solve(&mut *cont.member.write().unwrap());
+            .for_each(|cont| {
+                (*cont).fitness_score = problem.solve(&mut *cont.member.write().unwrap());
             });
     }
 
@@ -167,10 +172,11 @@ impl<T, E> Generation<T, E>
         // Loop over the members mutably to find a species which this member belongs to
         for cont in self.members.iter_mut() {
             // see if this member belongs to a given species 
+            let member = cont.member.read().unwrap();
             let mem_spec = self.species
                 .iter()
                 .find(|s| {
-                    <T as Genome<T, E>>::distance(&*cont.member.read().unwrap(), &*s.read().unwrap().mascot.read().unwrap(), Arc::clone(&settings)) < distance
+                    <T as Genome<T, E>>::distance(&*member, &*s.read().unwrap().mascot.read().unwrap(), Arc::clone(&settings)) < distance
                 });
             // if the member does belong to an existing species, add the two to each other 
             // otherwise create a new species and add that to the species and the member 
@@ -205,11 +211,13 @@ impl<T, E> Generation<T, E>
         // generating new members in a biased way using rayon to parallelize it
         // then crossover to fill the rest of the generation 
         let mut new_members = self.survival_criteria.pick_survivors(&mut self.members, &self.species)?;
+        // the species don't change while the children are made, so sum their fitness once up front
+        let species_fitness = ParentalCriteria::species_fitness_totals(&self.species);
         let children = (new_members.len() as i32..pop_size)
             .into_par_iter()
             .map(|_|{
                 // select two random species to crossover, with a chance of inbreeding then cross them over
-                let (one, two) = self.parental_criteria.pick_parents(config.inbreed_rate, &self.species).unwrap();
+                let (one, two) = self.parental_criteria.pick_parents_from(config.inbreed_rate, &self.species, &species_fitness).unwrap();
                 let child = if one.0 > two.0 {
                     <T as Genome<T, E>>::crossover(&*one.1.read().unwrap(), &*two.1.read().unwrap(), Arc::clone(&env), config.crossover_rate).unwrap()
                 } else {
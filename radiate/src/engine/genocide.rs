@@ -5,7 +5,7 @@ extern crate rayon;
 extern crate rand;  
 
 use std::marker::Sync;
-use std::sync::{Arc};
+use std::sync::{Weak};
 use rayon::prelude::*;
 use rand::Rng;
 use super::generation::{Generation};
@@ -77,20 +77,18 @@ impl Genocide {
     {
         generation.species
             .par_iter_mut()
-            .map_init(|| rand::thread_rng(), |r, spec| {
-                let mut new_members = Vec::new();
-                for mem in spec.read().unwrap().members.iter() {
-                    if r.gen::<f32>() > perc {
-                        let solid_member = mem.1.upgrade().unwrap();
-                        let copy_member = NicheMember(mem.0, Arc::downgrade(&solid_member));
-                        new_members.push(copy_member);
-                    }
-                }
+            .for_each_init(|| rand::thread_rng(), |r, spec| {
+                let mut lock_spec = spec.write().unwrap();
+                let new_members = lock_spec.members
+                    .iter()
+                    .filter(|_| r.gen::<f32>() > perc)
+                    .map(|mem| NicheMember(mem.0, Weak::clone(&mem.1)))
+                    .collect::<Vec<_>>();
                 if new_members.len() > 0 {
-                    spec.write().unwrap().members = new_members;
+                    lock_spec.members = new_members;
+                    lock_spec.update_cumulative_fitness();
                 }
-            })
-            .collect::<Vec<_>>();
+            });
     }
 
 
@@ -105,19 +103,16 @@ impl Genocide {
     {
         generation.species 
             .par_iter_mut()
-            .map(|spec| {
-                let size = spec.read().unwrap().members.len();
+            .for_each(|spec| {
+                let mut lock_spec = spec.write().unwrap();
+                let size = lock_spec.members.len();
                 let num_to_remove = size as f32 * perc;
-                spec.write().unwrap()
-                    .members
-                    .sort_by(|a, b| {
-                        b.0.partial_cmp(&a.0).unwrap()
-                    });
-                spec.write().unwrap()
-                    .members
-                    .truncate(size - num_to_remove as usize);
-            })
-            .collect::<Vec<_>>();
+                lock_spec.members.sort_by(|a, b| {
+                    b.0.partial_cmp(&a.0).unwrap()
+                });
+                lock_spec.members.truncate(size - num_to_remove as usize);
+                lock_spec.update_cumulative_fitness();
+            });
     }
 
 
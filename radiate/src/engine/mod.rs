@@ -89,4 +89,72 @@ pub mod problem {
         /// the member's score. The result of this function is the member's fitness score 
         fn solve(&self, member: &mut T) -> f32;
     }
-}
\ No newline at end of file
+}
+
+
+
+/// Innovation numbers for species and edges, and the map type used to look edges up by them.
+/// This is public because Dense::edge_innov_map is an InnovationMap, so anything building 
+/// or naming that field needs InnovationMap (InnovationMap::default() in place of HashMap::new())
+pub mod innovation {
+
+    use std::collections::HashMap;
+    use std::hash::{BuildHasherDefault, Hasher};
+    use rand::Rng;
+    use uuid::{Builder, Uuid, Variant, Version};
+
+    /// Map keyed by innovation number using the InnovationHasher
+    pub type InnovationMap<V> = HashMap<Uuid, V, BuildHasherDefault<InnovationHasher>>;
+
+    /// Species and innovation numbers only need to be unique, they don't need to be 
+    /// cryptographically random. Uuid::new_v4 asks the OS for fresh bytes on every call which 
+    /// becomes a syscall per edge when networks grow, so draw the bytes from the thread local 
+    /// rng (which is seeded once and buffered) and stamp them as a version 4 uuid
+    #[inline]
+    pub fn new_id() -> Uuid {
+        let bytes = rand::thread_rng().gen::<[u8; 16]>();
+        Builder::from_bytes(bytes)
+            .set_variant(Variant::RFC4122)
+            .set_version(Version::Random)
+            .build()
+    }
+
+    /// Innovation numbers are random already so running them through SipHash on every lookup
+    /// is wasted work. This folds the bytes in 8 at a time with a rotate, xor and multiply 
+    /// (the same mix FxHash uses) which is plenty to spread random ids across the table
+    #[derive(Debug, Default, Clone, Copy)]
+    pub struct InnovationHasher(u64);
+
+    impl InnovationHasher {
+        #[inline]
+        fn add_word(&mut self, word: u64) {
+            self.0 = (self.0.rotate_left(5) ^ word).wrapping_mul(0x517c_c1b7_2722_0a95);
+        }
+    }
+
+    impl Hasher for InnovationHasher {
+        #[inline]
+        fn finish(&self) -> u64 {
+            self.0
+        }
+
+        #[inline]
+        fn write(&mut self, bytes: &[u8]) {
+            for chunk in bytes.chunks(8) {
+                let mut word = [0_u8; 8];
+                word[..chunk.len()].copy_from_slice(chunk);
+                self.add_word(u64::from_le_bytes(word));
+            }
+        }
+
+        #[inline]
+        fn write_u64(&mut self, i: u64) {
+            self.add_word(i);
+        }
+
+        #[inline]
+        fn write_usize(&mut self, i: usize) {
+            self.add_word(i as u64);
+        }
+    }
+}
@@ -6,10 +6,10 @@ use std::sync::{Arc, RwLock};
 use std::marker::PhantomData;
 use uuid::Uuid;
 use rand::prelude::SliceRandom;
-use rayon::prelude::*;
 
 use super::generation::{Member, MemberWeak};
 use super::genome::{Genome};
+use super::innovation;
 
 
 
@@ -27,9 +27,12 @@ pub struct NicheMember<T>(pub f32, pub MemberWeak<T>);
 #[derive(Debug, Clone)]
 pub struct Niche<T, E> {
     pub mascot: Member<T>,
+    /// changing the members directly leaves the running totals of their fitness behind,
+    /// call update_cumulative_fitness once done to bring them back up to date
     pub members: Vec<NicheMember<T>>,
     pub age: i32,
     pub total_adjusted_fitness: Option<f32>,
+    cumulative_fitness: Vec<f32>,
     pub niche_id: Uuid,
     phantom: PhantomData<E>
 }
@@ -51,7 +54,8 @@ impl<T, E> Niche<T, E>
             members: vec![NicheMember(mascot_fitness, Arc::downgrade(mascot))],
             age: 0,
             total_adjusted_fitness: None,
-            niche_id: Uuid::new_v4(),
+            cumulative_fitness: Vec::new(),
+            niche_id: innovation::new_id(),
             phantom: PhantomData
         }
     }
@@ -87,8 +91,11 @@ impl<T, E> Niche<T, E>
             Some(member) => {
                 self.age += 1;
                 self.total_adjusted_fitness = None;
+                // keep the members' allocation around for the next generation since it
+                // will be filled back up to about the same size
                 self.mascot = Arc::new(RwLock::new((*member.1.upgrade().unwrap()).read().unwrap().clone()));
-                self.members = Vec::new();
+                self.members.clear();
+                self.cumulative_fitness.clear();
             }, 
             None => panic!("Failed to get new mascot")
         }
@@ -99,19 +106,15 @@ impl<T, E> Niche<T, E>
     // for species sizes which are large and populations holding multiple species,
     // it makes sense to just calculate this once then retrieve the the value
     // instead of calculate it every time it's needed. Its a quick and simple operation
+    // species are small enough that handing this to rayon costs more than it saves
     pub fn calculate_total_adjusted_fitness(&mut self) {
         let length = self.members.len() as f32;
-        self.total_adjusted_fitness = Some(
-            self.members
-                .par_iter_mut()
-                .map(|x| {
-                    if x.0 != 0.0 {
-                        x.0 = x.0 / length;
-                    }
-                    x.0
-                })
-                .sum()
-        )
+        for member in self.members.iter_mut() {
+            if member.0 != 0.0 {
+                member.0 = member.0 / length;
+            }
+        }
+        self.update_cumulative_fitness();
     }
 
 
@@ -138,3 +141,57 @@ impl<T, E> Niche<T, E>
 
 }
 
+
+
+/// Build the running totals of a list of fitness scores into totals and return the sum of the scores.
+/// Each entry holds the highest running total seen so far, which keeps the list sorted even when 
+/// some scores are negative, so a binary search over it lands on the exact same entry a walk 
+/// summing the scores would have
+pub(crate) fn running_fitness_totals<I>(scores: I, totals: &mut Vec<f32>) -> f32
+    where I: IntoIterator<Item = f32>
+{
+    let (mut running, mut highest) = (0.0, std::f32::MIN);
+    totals.clear();
+    for score in scores {
+        running += score;
+        highest = highest.max(running);
+        totals.push(highest);
+    }
+    running
+}
+
+
+
+/// Roulette helpers only touch the members' scores, so they don't need the genome bounds
+impl<T, E> Niche<T, E> {
+
+    /// Build the running totals of the members' adjusted fitness so picking a biased random 
+    /// member is a binary search instead of a walk through the whole species, and set the 
+    /// total adjusted fitness to their sum. This needs to be called again any time the members 
+    /// are changed. Returns the total
+    pub fn update_cumulative_fitness(&mut self) -> f32 {
+        let total = running_fitness_totals(self.members.iter().map(|member| member.0), &mut self.cumulative_fitness);
+        self.total_adjusted_fitness = Some(total);
+        total
+    }
+
+
+
+    /// Get the first member whose running total of adjusted fitness reaches the target. 
+    /// The running totals are only used while there is one for every member, if the members 
+    /// were changed without calling update_cumulative_fitness this walks them instead, which
+    /// gives the same member but takes O(n) instead of O(log n)
+    #[inline]
+    pub fn member_at_fitness(&self, target: f32) -> Option<&NicheMember<T>> {
+        if self.cumulative_fitness.len() != self.members.len() {
+            let mut running = 0.0;
+            return self.members.iter().find(|member| {
+                running += member.0;
+                running >= target
+            });
+        }
+        let index = self.cumulative_fitness.partition_point(|total| *total < target);
+        self.members.get(index)
+    }
+
+}
@@ -154,7 +154,10 @@ impl<T, E, P> Population<T, E, P>
         // create a new generation and return it
         self.curr_gen = self.curr_gen.create_next_generation(self.size, self.config.clone(), Arc::clone(&self.environment))?;
         // return the top member score and the member
-        Some((top_member.0, (*top_member.1).clone()))
+        // best_member hands back the only reference to its copy, so unwrap it instead of cloning the genome a second time
+        let top_score = top_member.0;
+        let top_genome = Arc::try_unwrap(top_member.1).unwrap_or_else(|shared| (*shared).clone());
+        Some((top_score, top_genome))
     }
 
     /// Check to see if the population is stagnant or not, if it is,
@@ -202,9 +205,9 @@ impl<T, E, P> Population<T, E, P>
                 Some(result) => {
                     let (fit, top) = result;
                     if runner(&top, fit, index) {
-                        let solution = top.clone();
+                        // train already handed back an owned copy of the top member, so just return it
                         let env = (*self.environment.read().unwrap()).clone();
-                        return Ok((solution, env));
+                        return Ok((top, env));
                     }
                     index += 1;
                 },
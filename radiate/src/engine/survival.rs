@@ -9,6 +9,7 @@ use rand::seq::SliceRandom;
 use rayon::prelude::*;
 use super::generation::{Container, Family, Member};
 use super::genome::Genome;
+use super::niche::running_fitness_totals;
 
 
 
@@ -105,13 +106,17 @@ impl SurvivalCriteria {
             T: Genome<T, E> + Send + Sync + Clone,
             E: Send + Sync
     {
-        members
-            .par_sort_by(|a, b| {
-                b.fitness_score.partial_cmp(&a.fitness_score).unwrap()
-            });
-        Some((0..num_to_keep)
-            .into_iter()
-            .map(|i| Arc::clone(&members[i].member))
+        // only the members above the cut off matter, not the order of everyone else, 
+        // so partition the generation around it instead of sorting the whole thing
+        if num_to_keep > 0 && num_to_keep < members.len() {
+            members
+                .select_nth_unstable_by(num_to_keep - 1, |a, b| {
+                    b.fitness_score.partial_cmp(&a.fitness_score).unwrap()
+                });
+        }
+        Some(members[..num_to_keep]
+            .iter()
+            .map(|x| Arc::clone(&x.member))
             .collect())
     }
 
@@ -130,10 +135,24 @@ impl ParentalCriteria {
         where
             T: Genome<T, E> + Send + Sync + Clone,
             E: Send + Sync 
+    {
+        self.pick_parents_from(inbreed_rate, families, &ParentalCriteria::species_fitness_totals(families))
+    }
+
+
+
+    /// Find two parents to crossover and produce a child using species fitness totals which were
+    /// already built by species_fitness_totals. When picking parents for a whole generation,
+    /// build the totals once and pass them to every call instead of summing the species each time
+    #[inline]
+    pub fn pick_parents_from<T, E>(&self, inbreed_rate: f32, families: &[Family<T, E>], species_fitness: &(Vec<f32>, f32)) -> Option<((f32, Member<T>), (f32, Member<T>))>
+        where
+            T: Genome<T, E> + Send + Sync + Clone,
+            E: Send + Sync 
     {
         match self {
             Self::BiasedRandom => {
-                return Some(self.create_match(inbreed_rate, families))
+                return Some(self.create_match(inbreed_rate, families, species_fitness))
             },
             Self::BestInSpecies => {
                 let mut r = rand::thread_rng();
@@ -150,7 +169,7 @@ impl ParentalCriteria {
     /// parents and returns a tuple of tuples where the f32 is the parent's fitness,
     /// and the type is the parent itself
     #[inline]
-    fn create_match<T, E>(&self, inbreed_rate: f32, families: &[Family<T, E>]) -> ((f32, Member<T>), (f32, Member<T>))
+    fn create_match<T, E>(&self, inbreed_rate: f32, families: &[Family<T, E>], species_fitness: &(Vec<f32>, f32)) -> ((f32, Member<T>), (f32, Member<T>))
         where
             T: Genome<T, E> + Send + Sync + Clone,
             E: Send + Sync
@@ -159,12 +178,12 @@ impl ParentalCriteria {
         let (species_one, species_two);
         // get two species to pick from taking into account an inbreeding rate - an inbreed can happen without this 
         if r.gen::<f32>() < inbreed_rate {
-            let temp = self.get_biased_random_species(&mut r, families).unwrap();
+            let temp = self.get_biased_random_species(&mut r, families, species_fitness).unwrap();
             species_one = Arc::clone(&temp);
             species_two = temp;
         } else {
-            species_one = self.get_biased_random_species(&mut r, families).unwrap();
-            species_two = self.get_biased_random_species(&mut r, families).unwrap();
+            species_one = self.get_biased_random_species(&mut r, families, species_fitness).unwrap();
+            species_two = self.get_biased_random_species(&mut r, families, species_fitness).unwrap();
         }
         // get two parents from the species, again the parent may be the same 
         let parent_one = self.get_biased_random_member(&mut r, &species_one);
@@ -182,32 +201,39 @@ impl ParentalCriteria {
     /// Statistically this allows for species with larger adjusted fitnesses to
     /// have a greater change of being picked for breeding
     #[inline]
-    fn get_biased_random_species<T, E>(&self, r: &mut ThreadRng, families: &[Family<T, E>]) -> Option<Family<T, E>>
+    fn get_biased_random_species<T, E>(&self, r: &mut ThreadRng, families: &[Family<T, E>], species_fitness: &(Vec<f32>, f32)) -> Option<Family<T, E>>
         where 
             T: Genome<T, E> + Send + Sync + Clone,
             E: Send + Sync
     {
-        // set a result option to none, this will panic! if the result is still none
-        // at the end of the function. Then get the total population fitness
-        let mut result = None;
-        let total = families.iter()
-            .fold(0.0, |sum, curr| {
-                sum + (*curr).read().unwrap().get_total_adjusted_fitness()
-            });
-
-        // iterate through the species until the iterative sum is at or above the selected
-        // random adjusted fitness level
-        let mut curr = 0.0;
+        // binary search the running totals for the first species whose sum is at or above 
+        // the selected random adjusted fitness level
+        let (totals, total) = species_fitness;
         let index = r.gen::<f32>() * total;
-        for i in families.iter() {
-            curr += i.read().ok()?.get_total_adjusted_fitness();
-            if curr >= index {
-                result = Some(Arc::clone(i));
-                break
-            }
-        }
-        // either return the result, or panic!
-        result.or_else(|| Some(Arc::clone(families.first()?)))
+        let result = totals.partition_point(|curr| *curr < index);
+        // either return the result, or fall back to the first species
+        families.get(result)
+            .or_else(|| families.first())
+            .map(Arc::clone)
+    }
+
+
+
+    /// Get the running totals of the species' adjusted fitness along with the total adjusted fitness
+    /// of the entire population. Each running total is the highest seen so far which keeps the 
+    /// list sorted even when a species has a negative fitness, so a binary search over it lands on
+    /// the same species a linear walk summing the species would
+    pub fn species_fitness_totals<T, E>(families: &[Family<T, E>]) -> (Vec<f32>, f32)
+        where 
+            T: Genome<T, E> + Send + Sync + Clone,
+            E: Send + Sync
+    {
+        let mut totals = Vec::with_capacity(families.len());
+        let total = running_fitness_totals(
+            families.iter().map(|family| family.read().unwrap().get_total_adjusted_fitness()),
+            &mut totals
+        );
+        (totals, total)
     }
 
 
@@ -225,15 +251,9 @@ impl ParentalCriteria {
         let species_lock = family.read().unwrap();
         let total = species_lock.get_total_adjusted_fitness();
         let index = r.gen::<f32>() * total;
-        let (mut result, mut curr) = (None, 0.0);
-        // go through each member and see if it's adjusted fitness has pushed it over the edge
-        for member in species_lock.members.iter() {
-            curr += member.0;
-            if curr >= index {
-                result = Some(member);
-                break
-            }
-        };
+        // binary search the species' running fitness totals for the first member whose 
+        // adjusted fitness pushes it over the edge
+        let result = species_lock.member_at_fitness(index);
         // either unwrap the result, or if the adjusted fitness of the species was all
         // negative, just take the first member. If the fitness of the species is negative,
         // the algorithm essentially preforms a random search for these biased functions 
@@ -1,5 +1,6 @@
 
 use uuid::Uuid;
+use crate::engine::innovation;
 use super::id::*;
 use super::neuron::*;
 
@@ -27,7 +28,7 @@ impl Edge {
             id,
             src,
             dst,
-            innov: Uuid::new_v4(),
+            innov: innovation::new_id(),
             weight,
             active
         }
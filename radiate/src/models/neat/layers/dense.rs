@@ -2,10 +2,11 @@ extern crate rand;
 
 use std::fmt;
 use std::any::Any;
-use std::collections::HashMap;
 use std::sync::{Arc, RwLock};
 use rand::Rng;
+use rand::rngs::ThreadRng;
 use rand::seq::SliceRandom;
+use rand::distributions::Uniform;
 
 use uuid::Uuid;
 
@@ -26,6 +27,7 @@ use super::super::{
 };
 
 use crate::Genome;
+use crate::engine::innovation::InnovationMap;
 
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -34,7 +36,7 @@ pub struct Dense {
     pub outputs: Vec<NeuronId>,
     pub nodes: Vec<Neuron>,
     pub edges: Vec<Edge>,
-    pub edge_innov_map: HashMap<Uuid, EdgeId>,
+    pub edge_innov_map: InnovationMap<EdgeId>,
     pub trace_states: Option<Tracer>,
     pub layer_type: LayerType,
     pub activation: Activation,
@@ -45,12 +47,14 @@ impl Dense {
     /// create a new fully connected dense layer.
     /// Each input is connected to each output with a randomly generated weight attached to the connection
     pub fn new(num_in: u32, num_out: u32, layer_type: LayerType, activation: Activation) -> Self {
+        // the layer is fully connected, so the final size of every collection is known up front
+        let num_edges = (num_in * num_out) as usize;
         let mut layer = Dense {
             inputs: vec![],
             outputs: vec![],
-            nodes: vec![],
-            edges: vec![],
-            edge_innov_map: HashMap::new(),
+            nodes: Vec::with_capacity((num_in + num_out) as usize),
+            edges: Vec::with_capacity(num_edges),
+            edge_innov_map: InnovationMap::with_capacity_and_hasher(num_edges, Default::default()),
             trace_states: None, 
             layer_type,
             activation,
@@ -118,6 +122,17 @@ impl Dense {
         self.edge_innov_map.get(innov).and_then(|edge_id| self.edges.get(edge_id.index()))
     }
 
+    /// Get the edge in this layer which matches another layer's edge. Layers that share an 
+    /// ancestor usually keep the same edge ids, so look in that slot first and only fall back 
+    /// to hashing the innovation number when the ids have drifted apart
+    #[inline]
+    pub fn get_matching_edge(&self, edge: &Edge) -> Option<&Edge> {
+        match self.edges.get(edge.id.index()) {
+            Some(candidate) if candidate.innov == edge.innov => Some(candidate),
+            _ => self.get_edge_by_innov(&edge.innov)
+        }
+    }
+
     /// Check if this layer contains an edge.
     pub fn contains_edge(&self, innov: &Uuid) -> bool {
         self.get_edge_by_innov(innov).is_some()
@@ -161,7 +176,7 @@ impl Dense {
         let new_node_id = self.make_node(NeuronType::Hidden, activation, direction);
 
         // get a random edge to insert the node into
-        let curr_edge = self.random_edge().clone();
+        let curr_edge = self.random_edge(&mut rand::thread_rng()).clone();
 
         // create two new edges that connect the src and the new node and the 
         // new node and dst, then disable the current edge 
@@ -187,15 +202,15 @@ impl Dense {
         // Can't use fast mode with hidden nodes.
         self.fast_mode = false;
 
-        // get a valid sending neuron
-        let sending = self.random_node_not_of_type(NeuronType::Output);
-        // get a vaild receiving neuron
-        let receiving = self.random_node_not_of_type(NeuronType::Input);
+        // get a valid sending neuron and a vaild receiving neuron, sharing one rng handle
+        // between every draw (including retries) instead of fetching it again each time
+        let mut r = rand::thread_rng();
+        let sending = self.random_node_not_of_type(NeuronType::Output, &mut r);
+        let receiving = self.random_node_not_of_type(NeuronType::Input, &mut r);
 
         // determine if the connection to be made is valid 
         if self.valid_connection(sending, receiving) {
             // if the connection is valid, make it and wire the nodes to each
-            let mut r = rand::thread_rng();
             self.make_edge(sending, receiving, r.gen::<f32>());
         }
     }
@@ -217,9 +232,12 @@ impl Dense {
     }
 
     /// check to see if the connection to be made would create a cycle in the graph
-    /// and therefore make it network invalid and unable to feed forward
+    /// and therefore make it network invalid and unable to feed forward. The layer is a DAG
+    /// where many paths can lead to the same neuron, so remember which neurons have already 
+    /// been searched instead of walking every path through them again
     fn cyclical(&self, sending: NeuronId, receiving: NeuronId) -> bool {
         let recv_node = self.nodes.get(receiving.index()).unwrap();
+        let mut visited = vec![false; self.nodes.len()];
         // dfs stack which gets the receiving Neuron<dyn neurons> outgoing connections
         let mut stack = recv_node.outgoing_edges()
             .iter()
@@ -228,6 +246,10 @@ impl Dense {
 
         // while the stack still has nodes, continue
         while let Some(node_idx) = stack.pop() {
+            if visited[node_idx] {
+                continue;
+            }
+            visited[node_idx] = true;
             // if the current node is the same as the sending, this would cause a cycle
             // else add all the current node's outputs to the stack to search through
             let curr = self.nodes.get(node_idx).unwrap();
@@ -243,28 +265,27 @@ impl Dense {
     }
 
     /// check if the desired connection already exists within he network, if it does then
-    /// we should not be creating the connection.
+    /// we should not be creating the connection. Every edge ever made into a neuron stays in
+    /// that neuron's incoming links (disabled ones just hold a zero weight), so only the
+    /// receiving neuron's links need to be checked instead of every edge in the layer
     fn exists(&self, sending: NeuronId, receiving: NeuronId) -> bool {
-        for val in self.edges.iter() {
-            if val.src == sending && val.dst == receiving {
-                return true
-            }
-        }
-        false
+        self.nodes.get(receiving.index())
+            .map(|node| node.incoming_edges().iter().any(|link| link.src == sending))
+            .unwrap_or(false)
     }
 
     /// get a random node from the network
-    fn random_node(&self) -> &Neuron {
-        let index = rand::thread_rng().gen_range(0, self.nodes.len());
+    fn random_node(&self, r: &mut ThreadRng) -> &Neuron {
+        let index = r.gen_range(0, self.nodes.len());
         let node = self.nodes.get(index)
             .expect("Failed to get random node");
         return node;
     }
 
     /// get a random node from the network not of the specific type
-    fn random_node_not_of_type(&self, node_type: NeuronType) -> NeuronId {
+    fn random_node_not_of_type(&self, node_type: NeuronType, r: &mut ThreadRng) -> NeuronId {
         loop {
-            let node = self.random_node();
+            let node = self.random_node(r);
             if node.neuron_type != node_type {
                 break node.id;
             }
@@ -273,8 +294,8 @@ impl Dense {
 
 
     /// get a random connection from the network
-    fn random_edge(&self) -> &Edge {
-        let index = rand::thread_rng().gen_range(0, self.edges.len());
+    fn random_edge(&self, r: &mut ThreadRng) -> &Edge {
+        let index = r.gen_range(0, self.edges.len());
         self.edges.get(index)
             .expect("Failed to get random edge")
     }
@@ -284,20 +305,25 @@ impl Dense {
     /// them, or giving them an entire new weight all together
     fn edit_weights(&mut self, editable: f32, size: f32) {
         let mut r = rand::thread_rng();
+        // build the perturbation range the first time something is perturbed and reuse it after that,
+        // a range can't be built when size <= 0 so it must not be built if nothing is ever perturbed
+        let mut perturb = None;
+        // set the new weights on the edges first, then push them to the neurons' incoming
+        // links in one pass instead of searching the destination node's links for every edge
         for edge in self.edges.iter_mut() {
-            let weight = if r.gen::<f32>() < editable {
+            edge.weight = if r.gen::<f32>() < editable {
                 r.gen::<f32>()
             } else {
-                edge.weight * r.gen_range(-size, size)
+                edge.weight * r.sample(&*perturb.get_or_insert_with(|| Uniform::new(-size, size)))
             };
-            edge.update_weight(weight, &mut self.nodes);
         }
         for node in self.nodes.iter_mut() {
             if r.gen::<f32>() < editable {
                 node.bias = r.gen::<f32>();
             } else {
-                node.bias *= r.gen_range(-size, size);
+                node.bias *= r.sample(&*perturb.get_or_insert_with(|| Uniform::new(-size, size)));
             }
+            node.sync_incoming(&self.edges);
         }
     }
 
@@ -352,12 +378,27 @@ impl Dense {
     }
 
 
+    /// Shared end of both forward passes. Softmax needs every output neuron's state 
+    /// before any of them can be activated, so only then are the outputs re-processed
+    fn finish_forward(&mut self, outputs: Vec<f32>) -> Option<Vec<f32>> {
+        if self.activation == Activation::Softmax {
+            self.set_output_values();
+
+            self.update_traces();
+            self.get_outputs()
+        } else {
+            self.update_traces();
+            Some(outputs)
+        }
+    }
+
+
     fn fast_forward(&mut self, data: &[f32]) -> Option<Vec<f32>> {
         let in_size = self.inputs.len();
 
         // First phase: update input neurons
         for (node, value) in self.nodes[0..in_size].iter_mut().zip(data.iter()) {
-            assert!(node.neuron_type == NeuronType::Input);
+            debug_assert!(node.neuron_type == NeuronType::Input);
             // reset neuron
             node.reset_neuron();
 
@@ -371,7 +412,7 @@ impl Dense {
         // Second phase: update output neurons
         let end_idx = self.nodes.len();
         for node in self.nodes[in_size..end_idx].iter_mut() {
-            assert!(node.neuron_type == NeuronType::Output);
+            debug_assert!(node.neuron_type == NeuronType::Output);
             // reset neuron
             node.reset_neuron();
 
@@ -388,16 +429,7 @@ impl Dense {
 
         // once we've made it through the network, the outputs should all
         // have calculated their values. Gather the values and return the vec
-        if self.activation == Activation::Softmax {
-            // Only need to re-process output neurons for Softmax activation.
-            self.set_output_values();
-
-            self.update_traces();
-            self.get_outputs()
-        } else {
-            self.update_traces();
-            Some(outputs)
-        }
+        self.finish_forward(outputs)
     }
 }
 
@@ -591,16 +623,7 @@ impl Layer for Dense {
 
         // once we've made it through the network, the outputs should all
         // have calculated their values. Gather the values and return the vec
-        if self.activation == Activation::Softmax {
-            // Only need to re-process output neurons for Softmax activation.
-            self.set_output_values();
-
-            self.update_traces();
-            self.get_outputs()
-        } else {
-            self.update_traces();
-            Some(outputs)
-        }
+        self.finish_forward(outputs)
     }
 
 
@@ -735,18 +758,30 @@ impl Genome<Dense, NeatEnvironment> for Dense
         let set = (*env).read().ok()?;
         let mut r = rand::thread_rng();
         if r.gen::<f32>() < crossover_rate {
+            // pull the reactivate rate out of the environment once instead of reading it for every edge
+            let reactivate = set.reactivate;
+            // picking which parent's weight to keep is a fair coin flip per edge, so pull 64
+            // flips out of a single random word instead of generating a float for every edge
+            let (mut coins, mut coins_left) = (0_u64, 0);
             for edge in new_child.edges.iter_mut() {
                 // if the edge is in both networks, then randomly assign the weight to the edge
                 // because we are already looping over the most fit parent, we only need to change the 
                 // weight to the second parent if necessary.
-                if let Some(parent_edge) = parent_two.get_edge_by_innov(&edge.innov) {
-                    if r.gen::<f32>() < 0.5 {
+                if let Some(parent_edge) = parent_two.get_matching_edge(edge) {
+                    if coins_left == 0 {
+                        coins = r.gen::<u64>();
+                        coins_left = 64;
+                    }
+                    let heads = coins & 1 == 1;
+                    coins >>= 1;
+                    coins_left -= 1;
+                    if heads {
                         edge.update_weight(parent_edge.weight, &mut new_child.nodes);
                     }
 
                     // if the edge is deactivated in either network and a random number is less than the 
                     // reactivate parameter, then reactivate the edge and insert it back into the network
-                    if (!edge.active || !parent_edge.active) && r.gen::<f32>() < set.reactivate? {
+                    if (!edge.active || !parent_edge.active) && r.gen::<f32>() < reactivate? {
                         edge.enable(&mut new_child.nodes);
                     }
                 }
@@ -782,7 +817,8 @@ impl Genome<Dense, NeatEnvironment> for Dense
     fn distance(one: &Dense, two: &Dense, _: Arc<RwLock<NeatEnvironment>>) -> f32 {
         let mut similar = 0.0;
         for innov in one.edge_innov_map.keys() {
-            if two.contains_edge(innov) {
+            // every innovation in the map points at an edge in the layer, so a key check is enough
+            if two.edge_innov_map.contains_key(innov) {
                 similar += 1.0;
             }
         }
@@ -797,7 +833,9 @@ impl Genome<Dense, NeatEnvironment> for Dense
 /// it must be able to compare one to another
 impl PartialEq for Dense {
     fn eq(&self, other: &Self) -> bool {
-        if self.edges.len() != other.edges.len() || self.nodes.len() != other.nodes.len() {
+        if std::ptr::eq(self, other) {
+            return true;
+        } else if self.edges.len() != other.edges.len() || self.nodes.len() != other.nodes.len() {
             return false;
         } 
         for (one, two) in self.edges.iter().zip(other.edges.iter()) {
@@ -66,11 +66,13 @@ impl Layer for GRU {
     /// implement the propagation function for the GRU layer 
     #[inline]
     fn forward(&mut self, inputs: &Vec<f32>) -> Option<Vec<f32>> {
-        let mut concat_input_output = self.current_output.clone();
-        concat_input_output.extend(inputs);
-
-        let mut network_input = concat_input_output.clone();
-        network_input.extend(&self.current_memory);
+        // the gates all take [output, input, memory] so build that once with the right 
+        // size and swap the memory at the end out for the output gate later on
+        let memory_start = self.current_output.len() + inputs.len();
+        let mut network_input = Vec::with_capacity(memory_start + self.current_memory.len());
+        network_input.extend_from_slice(&self.current_output);
+        network_input.extend_from_slice(inputs);
+        network_input.extend_from_slice(&self.current_memory);
 
         // calculate memory updates
         let mut forget = self.f_gate.forward(&network_input)?;
@@ -83,10 +85,11 @@ impl Layer for GRU {
         vectorops::element_add(&mut self.current_memory, &memory);
 
         // add the new memory for the input to the output network of the layer
-        concat_input_output.extend(&self.current_memory);
+        network_input.truncate(memory_start);
+        network_input.extend_from_slice(&self.current_memory);
 
         // calculate the current output of the layer
-        self.current_output = self.o_gate.forward(&concat_input_output)?;
+        self.current_output = self.o_gate.forward(&network_input)?;
         Some(self.current_output.clone())
     }
 
@@ -201,3 +204,17 @@ impl fmt::Display for GRU {
           self.input_size, self.memory_size, self.output_size)
     }
 }
+
+
+
+/// GRU layers are equal if they have the same shape and all three of their gates are equal
+impl PartialEq for GRU {
+    fn eq(&self, other: &Self) -> bool {
+        self.input_size == other.input_size
+            && self.memory_size == other.memory_size
+            && self.output_size == other.output_size
+            && self.f_gate == other.f_gate
+            && self.e_gate == other.e_gate
+            && self.o_gate == other.o_gate
+    }
+}
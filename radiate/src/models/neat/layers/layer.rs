@@ -1,6 +1,11 @@
 
 use std::any::Any;
 use std::fmt::Debug;
+use super::{
+    dense::Dense,
+    lstm::LSTM,
+    gru::GRU
+};
 
 
 /// Layer is a layer in the neural network. In order for 
@@ -75,9 +80,24 @@ impl Clone for Box<dyn Layer> {
 }
 
 
-/// Need to able to compare dyn layers (is there a better way to do this?)
+/// Need to able to compare dyn layers. Comparing the trait objects directly just calls 
+/// back into this impl forever, so downcast both sides to the concrete layer type and compare 
+/// those - layers of different types are never equal
 impl PartialEq for dyn Layer {
     fn eq(&self, other: &Self) -> bool {
-        self == other
+        let (one, two) = (self.as_ref_any(), other.as_ref_any());
+        if std::ptr::eq(one as *const dyn Any as *const u8, two as *const dyn Any as *const u8) {
+            return true;
+        }
+        if let (Some(one), Some(two)) = (one.downcast_ref::<Dense>(), two.downcast_ref::<Dense>()) {
+            return one == two;
+        }
+        if let (Some(one), Some(two)) = (one.downcast_ref::<LSTM>(), two.downcast_ref::<LSTM>()) {
+            return one == two;
+        }
+        if let (Some(one), Some(two)) = (one.downcast_ref::<GRU>(), two.downcast_ref::<GRU>()) {
+            return one == two;
+        }
+        false
     }
 }
@@ -1,10 +1,10 @@
 
 extern crate rand;
+extern crate rayon;
 
 use std::fmt;
 use std::any::Any;
 use std::sync::{Arc, RwLock};
-use std::thread;
 use super::{
     layertype::LayerType,
     layer::Layer,
@@ -108,39 +108,36 @@ impl LSTM {
 
 
 
-    /// Feed forward with each forward propagation being executed in a separate thread to speed up
+    /// Feed forward with each gate's forward propagation being executed on the rayon pool to speed up
     /// the forward pass if the network is NOT being evolved. If it is, there are already so many threads
     /// working to optimize the entire population that extra threading is unnecessary and might actually slow it down
     #[inline]
     pub fn step_forward_async(&mut self, inputs: &[f32]) -> Option<Vec<f32>> {
         // get the previous state and output and create the input to the layer
-        let mut hidden_input = self.hidden.clone();
-        hidden_input.extend(inputs);
-
-        // clone all the gates to prevent lifetime conflicts
-        let g_gate_clone = Arc::clone(&self.g_gate);
-        let o_gate_clone = Arc::clone(&self.o_gate);
-        let f_gate_clone = Arc::clone(&self.f_gate);
-        let i_gate_clone = Arc::clone(&self.i_gate);
-
-        // get all the gate outputs 
-        let hidden_async = Arc::new(hidden_input);
-        let g_input = Arc::clone(&hidden_async);
-        let o_input = Arc::clone(&hidden_async);
-        let f_input = Arc::clone(&hidden_async);
-        let i_input = Arc::clone(&hidden_async);
-
-        // spawn the threads 
-        let g_output = thread::spawn(move || { return g_gate_clone.write().unwrap().forward(&*g_input).unwrap(); });
-        let o_output = thread::spawn(move || { return o_gate_clone.write().unwrap().forward(&*o_input).unwrap(); });
-        let f_output = thread::spawn(move || { return f_gate_clone.write().unwrap().forward(&*f_input).unwrap(); });
-        let i_output = thread::spawn(move || { return i_gate_clone.write().unwrap().forward(&*i_input).unwrap(); });
+        let mut hidden_input = Vec::with_capacity(self.hidden.len() + inputs.len());
+        hidden_input.extend_from_slice(&self.hidden);
+        hidden_input.extend_from_slice(inputs);
+
+        // get all the gate outputs, the gates are independent of each other so run them on the 
+        // rayon pool instead of spawning (and tearing down) a new os thread for every gate every step
+        let (g_gate, o_gate, f_gate, i_gate) = (&self.g_gate, &self.o_gate, &self.f_gate, &self.i_gate);
+        let hidden_input = &hidden_input;
+        let ((g_output, o_output), (f_output, i_output)) = rayon::join(
+            || rayon::join(
+                || g_gate.write().unwrap().forward(hidden_input),
+                || o_gate.write().unwrap().forward(hidden_input)
+            ),
+            || rayon::join(
+                || f_gate.write().unwrap().forward(hidden_input),
+                || i_gate.write().unwrap().forward(hidden_input)
+            )
+        );
 
         // current memory and output need to be mutable but we also want to save that data for bptt
-        let mut curr_state = g_output.join().ok()?;
-        let mut curr_output = o_output.join().ok()?;
-        let f_curr = f_output.join().ok()?;
-        let i_curr = i_output.join().ok()?;
+        let mut curr_state = g_output?;
+        let mut curr_output = o_output?;
+        let f_curr = f_output?;
+        let i_curr = i_output?;
 
         let g_out = curr_state.clone();
         let o_out = curr_output.clone();
@@ -167,18 +164,15 @@ impl LSTM {
     pub fn step_forward(&mut self, inputs: &[f32]) -> Option<Vec<f32>> {
         // get the previous state and output and create the input to the layer
         // let mut previous_state = &mut self.memory;
-        let mut hidden_input = self.hidden.clone();
-        hidden_input.extend(inputs);
+        let mut hidden_input = Vec::with_capacity(self.hidden.len() + inputs.len());
+        hidden_input.extend_from_slice(&self.hidden);
+        hidden_input.extend_from_slice(inputs);
 
         // get all the gate outputs 
         let f_output = self.f_gate.write().unwrap().forward(&hidden_input)?;
         let i_output = self.i_gate.write().unwrap().forward(&hidden_input)?;
-        let o_output = self.o_gate.write().unwrap().forward(&hidden_input)?;
-        let g_output = self.g_gate.write().unwrap().forward(&hidden_input)?;
-
-        // current memory and output need to be mutable but we also want to save that data for bptt
-        let mut current_state = g_output.clone();
-        let mut current_output = o_output.clone();
+        let mut current_output = self.o_gate.write().unwrap().forward(&hidden_input)?;
+        let mut current_state = self.g_gate.write().unwrap().forward(&hidden_input)?;
 
         // update the current state 
         vectorops::element_multiply(&mut self.memory, &f_output);
@@ -222,10 +216,6 @@ impl LSTM {
         let mut dho = vectorops::element_activate(&c_old, Activation::Tanh);
         vectorops::element_multiply(&mut dho, &dh);
         vectorops::element_multiply(&mut dho, &vectorops::element_deactivate(&o_curr, self.o_gate.read().unwrap().activation));
-        let o_gate_clone = Arc::clone(&self.o_gate);
-        let o_handle = thread::spawn(move || { 
-            return o_gate_clone.write().unwrap().backward(&dho, l_rate).unwrap(); 
-        });
         
         // Gradient for c in h = ho * tanh(c), note we're adding dc_next here     
         // dc = ho * dh * dtanh(c)
@@ -239,38 +229,40 @@ impl LSTM {
         // dhf = dsigmoid(hf) * dhf
         let mut dhf = vectorops::product(&c_old, &dc);
         vectorops::element_multiply(&mut dhf, &vectorops::element_deactivate(&f_curr, self.f_gate.read().unwrap().activation));
-        let f_gate_clone = Arc::clone(&self.f_gate);
-        let f_handle = thread::spawn(move || { 
-            return f_gate_clone.write().unwrap().backward(&dhf, l_rate).unwrap(); 
-        });
 
         // Gradient for hi in c = hf * c_old + hi * hc     
         // dhi = hc * dc
         // dhi = dsigmoid(hi) * dhi
         let mut dhi = vectorops::product(&g_curr, &dc);
         vectorops::element_multiply(&mut dhi, &vectorops::element_deactivate(&i_curr, self.i_gate.read().unwrap().activation));
-        let i_gate_clone = Arc::clone(&self.i_gate);
-        let i_handle = thread::spawn(move || { 
-            return i_gate_clone.write().unwrap().backward(&dhi, l_rate).unwrap(); 
-        });
 
         // Gradient for hc in c = hf * c_old + hi * hc     
         // dhc = hi * dc
         // dhc = dtanh(hc) * dhc
         let mut dhc = vectorops::product(&i_curr, &dc);
         vectorops::element_multiply(&mut dhc, &vectorops::element_deactivate(&g_curr, self.g_gate.read().unwrap().activation));
-        let g_gate_clone = Arc::clone(&self.g_gate);
-        let g_handle = thread::spawn(move || { 
-            return g_gate_clone.write().unwrap().backward(&dhc, l_rate).unwrap(); 
-        });
+
+        // backpropagate each gate's gradient through its network, the gates don't depend 
+        // on each other so let rayon run them in parallel
+        let (g_gate, o_gate, f_gate, i_gate) = (&self.g_gate, &self.o_gate, &self.f_gate, &self.i_gate);
+        let ((o_error, f_error), (i_error, g_error)) = rayon::join(
+            || rayon::join(
+                || o_gate.write().unwrap().backward(&dho, l_rate),
+                || f_gate.write().unwrap().backward(&dhf, l_rate)
+            ),
+            || rayon::join(
+                || i_gate.write().unwrap().backward(&dhi, l_rate),
+                || g_gate.write().unwrap().backward(&dhc, l_rate)
+            )
+        );
 
         // As X was used in multiple gates, the gradient must be accumulated here     
         // dX = dXo + dXc + dXi + dXf
         let mut dx = vec![0.0; (self.input_size + self.memory_size) as usize];
-        vectorops::element_add(&mut dx, &o_handle.join().ok()?);
-        vectorops::element_add(&mut dx, &f_handle.join().ok()?);
-        vectorops::element_add(&mut dx, &i_handle.join().ok()?);
-        vectorops::element_add(&mut dx, &g_handle.join().ok()?);
+        vectorops::element_add(&mut dx, &o_error?);
+        vectorops::element_add(&mut dx, &f_error?);
+        vectorops::element_add(&mut dx, &i_error?);
+        vectorops::element_add(&mut dx, &g_error?);
         
         // Split the concatenated X, so that we get our gradient of h_old     
         // dh_next = dx[:, :H]
@@ -296,7 +288,7 @@ impl Layer for LSTM {
 
     /// forward propagate inputs, if the model is being evolved don't spawn extra threads because
     /// it slows down the process by about double the original time. If the model is being trained
-    /// traditionally, step forward asynchronously by spawning a thread for each individual gate
+    /// traditionally, step forward asynchronously by running each individual gate on the rayon pool
     /// which results in speeds about double as a synchronous thread.
     #[inline]
     fn forward(&mut self, inputs: &Vec<f32>) -> Option<Vec<f32>> {
@@ -452,3 +444,24 @@ impl fmt::Display for LSTM {
           self.input_size, self.memory_size, self.output_size)
     }
 }
+
+
+
+/// LSTM layers are equal if they have the same shape, activation, and all of their gates are equal. 
+/// Gates shared between the two layers are the same gate, so don't bother locking them
+impl PartialEq for LSTM {
+    fn eq(&self, other: &Self) -> bool {
+        let same_gate = |one: &Arc<RwLock<Dense>>, two: &Arc<RwLock<Dense>>| {
+            Arc::ptr_eq(one, two) || *one.read().unwrap() == *two.read().unwrap()
+        };
+        self.input_size == other.input_size
+            && self.memory_size == other.memory_size
+            && self.output_size == other.output_size
+            && self.activation == other.activation
+            && same_gate(&self.g_gate, &other.g_gate)
+            && same_gate(&self.i_gate, &other.i_gate)
+            && same_gate(&self.f_gate, &other.f_gate)
+            && same_gate(&self.o_gate, &other.o_gate)
+            && same_gate(&self.v_gate, &other.v_gate)
+    }
+}
@@ -111,15 +111,13 @@ pub fn loss(one: &[f32], two: &[f32], loss_fn: &Loss) -> (f32, Vec<f32>) {
             return (total, difference);
         },
         Loss::MSE => {
-            let mut squared_error = 0.0;
+            // keep the element-wise pass free of the running total so it can be vectorized,
+            // then sum the squared errors in a second pass over the contiguous buffer
             let errs = one.iter()
                 .zip(two.iter())
-                .map(|(i, j)| {
-                    let e = (i - j).powf(2.0);
-                    squared_error += e;
-                    e
-                })
+                .map(|(i, j)| (i - j) * (i - j))
                 .collect::<Vec<_>>();
+            let squared_error = errs.iter().sum::<f32>();
             return ((1.0 / one.len() as f32) * squared_error, errs);
 
         }
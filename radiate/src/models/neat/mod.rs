@@ -32,8 +32,6 @@ pub mod loss {
 #[allow(deprecated)]
 pub mod activation {
 
-    use std::f32::consts::E as Eul;
-
     /// Various activation functions for a neuron, must be specified at creation
     #[derive(Deserialize, Serialize, Debug, PartialEq, Clone, Copy)]
     pub enum Activation {
@@ -84,7 +82,7 @@ pub mod activation {
                     if x >= 0.0 {
                         return x;
                     }
-                    alpha * (Eul.powf(x) - 1.0)
+                    alpha * x.exp_m1()
                 },
                 _ => panic!("Cannot activate single neuron")
 
@@ -98,16 +96,18 @@ pub mod activation {
         pub fn deactivate(&self, x: f32) -> f32 {
             match self {
                 Self::Sigmoid => {
-                    self.activate(x) * (1.0 - self.activate(x))
+                    let a = self.activate(x);
+                    a * (1.0 - a)
                 },
                 Self::Tanh | Self::Tahn => {
-                    1.0 - (self.activate(x)).powf(2.0)
+                    let a = self.activate(x);
+                    1.0 - a * a
                 },
                 Self::Linear(alpha) => {
                     *alpha
                 },
                 Self::Relu => {
-                    if self.activate(x) > 0.0 { 
+                    if x > 0.0 { 
                         return 1.0;
                     }
                     0.0
@@ -127,6 +127,25 @@ pub mod activation {
                 _ => panic!("Cannot deactivate single neuron")
             }
         }
+
+
+
+        /// Activate and deactivate in one go. Sigmoid and tanh derivatives can be written in 
+        /// terms of the activated value, so the exp/tanh only has to be evaluated once per neuron
+        #[inline]
+        pub fn activate_with_derivative(&self, x: f32) -> (f32, f32) {
+            match self {
+                Self::Sigmoid => {
+                    let a = self.activate(x);
+                    (a, a * (1.0 - a))
+                },
+                Self::Tanh | Self::Tahn => {
+                    let a = self.activate(x);
+                    (a, 1.0 - a * a)
+                },
+                _ => (self.activate(x), self.deactivate(x))
+            }
+        }
     }
 }
 
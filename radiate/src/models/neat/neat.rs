@@ -2,6 +2,7 @@ extern crate rand;
 extern crate serde_json;
 
 use std::fs::File;
+use std::io::{BufReader, BufWriter, Write};
 use std::error::Error;
 use std::sync::{Arc, RwLock};
 
@@ -102,10 +103,11 @@ impl Neat {
         assert!(inputs.len() == targets.len(), "Input and target data are different sizes");
         assert!(inputs[0].len() as u32 == self.input_size, "Input size is different than network input size");
 
-        // feed the input data through the network then back prop it back through to edit the weights of the layers
+        // feed the input data through the network then back prop it back through to edit the weights of the layers.
+        // a batch is always a run of consecutive inputs, so its targets can be sliced straight out of 
+        // the target data and only the outputs need a buffer, which is reused from batch to batch
         let mut pass_out = Vec::with_capacity(self.batch_size);
-        let mut pass_tar = Vec::with_capacity(self.batch_size);
-        let (mut epoch, mut count, mut loss) = (0, 0, 0.0);
+        let (mut epoch, mut count, mut batch_start, mut loss) = (0, 0, 0, 0.0);
         
         // add tracers to the layers during training to keep track of meta data for backprop
         if self.batch_size > 1 {
@@ -119,12 +121,11 @@ impl Neat {
             for j in 0..inputs.len() {
                 count += 1;
                 pass_out.push(self.forward(&inputs[j]).ok_or("Error in network feed forward")?);
-                pass_tar.push(targets[j].clone());
                 if count == self.batch_size || j == inputs.len() - 1 {
                     count = 0;
-                    loss += self.backward(&pass_out, &pass_tar, rate, &loss_fn);
-                    pass_out = Vec::with_capacity(self.batch_size);
-                    pass_tar = Vec::with_capacity(self.batch_size);
+                    loss += self.backward(&pass_out, &targets[batch_start..=j], rate, &loss_fn);
+                    pass_out.clear();
+                    batch_start = j + 1;
                 }
             }
             if run(epoch, loss) {
@@ -132,6 +133,7 @@ impl Neat {
             }
             epoch += 1;
             loss = 0.0;            
+            batch_start = 0;
         }
  
         // remove the tracers from the layers before finishing
@@ -167,15 +169,17 @@ impl Neat {
     /// feed forward a vec of data through the neat network 
     #[inline]
     pub fn forward(&mut self, data: &Vec<f32>) -> Option<Vec<f32>> {
-        // keep two vec in order to transfer the data from one layer to another layer in the network
-        let mut temp;
-        let mut data_transfer = data;
-        for wrapper in self.layers.iter_mut() {
-            temp = wrapper.layer.forward(data_transfer)?;
-            data_transfer = &temp;
+        // the first layer reads straight from the input, after that each layer's output
+        // is handed to the next, so the last output can be returned without another copy
+        let mut layers = self.layers.iter_mut();
+        let mut output = match layers.next() {
+            Some(wrapper) => wrapper.layer.forward(data)?,
+            None => return Some(data.clone())
+        };
+        for wrapper in layers {
+            output = wrapper.layer.forward(&output)?;
         }
-        // gather the output and return it as an option
-        Some(data_transfer.to_owned())
+        Some(output)
     }    
 
 
@@ -249,7 +253,10 @@ impl Neat {
     
     /// dumy model saver file to export the model to json
     pub fn save(&self, file_path: &str) -> Result<(), Box<dyn Error>> {
-        serde_json::to_writer_pretty(&File::create(file_path)?, &self)?;
+        // serde_json emits lots of tiny writes, buffer them so saving isn't one syscall per token
+        let mut writer = BufWriter::new(File::create(file_path)?);
+        serde_json::to_writer_pretty(&mut writer, &self)?;
+        writer.flush()?;
         Ok(())
     }
 
@@ -257,7 +264,8 @@ impl Neat {
 
     /// load in a saved neat model from a file path
     pub fn load(file_path: &str) -> Result<Neat, Box<dyn Error>> {
-        Ok(serde_json::from_reader(File::open(file_path).expect("file not found")).expect("error while reading json"))
+        let reader = BufReader::new(File::open(file_path).expect("file not found"));
+        Ok(serde_json::from_reader(reader).expect("error while reading json"))
     }
 
 
@@ -289,6 +297,13 @@ impl Clone for Neat {
 /// it must be able to compare one to another
 impl PartialEq for Neat {
     fn eq(&self, other: &Self) -> bool {
+        // a network is always equal to itself and never equal to one with a different number
+        // of layers, both are much cheaper to check than walking every layer's edges
+        if std::ptr::eq(self, other) {
+            return true;
+        } else if self.layers.len() != other.layers.len() {
+            return false;
+        }
         for (one, two) in self.layers.iter().zip(other.layers.iter()) {
             if &one.layer != &two.layer {
                 return false;
@@ -83,6 +83,16 @@ impl Neuron {
         }
     }
 
+    /// Refresh the weight of every incoming link from the layer's edge list in a single pass,
+    /// the same as calling Edge::update_weight for each of them
+    pub fn sync_incoming(&mut self, edges: &[Edge]) {
+        for link in self.incoming.iter_mut() {
+            if let Some(edge) = edges.get(link.id.index()) {
+                link.weight = edge.weight;
+            }
+        }
+    }
+
     /// Remove incoming edge
     pub fn remove_incoming(&mut self, edge: &Edge) {
         self.incoming.retain(|x| x.id != edge.id);
@@ -110,12 +120,14 @@ impl Neuron {
         if self.activation != Activation::Softmax {
             match self.direction {
                 NeuronDirection::Forward => {
-                    self.activated_value = self.activation.activate(self.current_state);
-                    self.deactivated_value = self.activation.deactivate(self.current_state);
+                    let (activated, deactivated) = self.activation.activate_with_derivative(self.current_state);
+                    self.activated_value = activated;
+                    self.deactivated_value = deactivated;
                 },
                 NeuronDirection::Recurrent => {
-                    self.activated_value = self.activation.activate(self.current_state + self.previous_state);
-                    self.deactivated_value = self.activation.deactivate(self.current_state + self.previous_state);
+                    let (activated, deactivated) = self.activation.activate_with_derivative(self.current_state + self.previous_state);
+                    self.activated_value = activated;
+                    self.deactivated_value = deactivated;
                 }
             }
             self.previous_state = self.current_state;
@@ -1,16 +1,16 @@
 
-use std::collections::HashMap;
-
 use super::id::*;
 
 
 /// Tracer keeps track of historical metadata for neurons to keep track
 /// of their activated values and derivatives so backpropagation (through time)
-/// is available for batch processing and weight updates
+/// is available for batch processing and weight updates. Neuron ids are dense
+/// indexes into the layer's node list, so the histories are stored in a table 
+/// indexed by that id instead of being hashed on every lookup
 #[derive(Deserialize, Serialize, Debug, Clone)]
 pub struct Tracer {
-    pub neuron_activation: HashMap<NeuronId, Vec<f32>>,
-    pub neuron_derivative: HashMap<NeuronId, Vec<f32>>,
+    pub neuron_activation: Vec<Vec<f32>>,
+    pub neuron_derivative: Vec<Vec<f32>>,
     pub max_neuron_index: usize,
     pub index: usize,
 }
@@ -21,8 +21,8 @@ impl Tracer {
 
     pub fn new() -> Self {
         Tracer {
-            neuron_activation: HashMap::new(),
-            neuron_derivative: HashMap::new(),        
+            neuron_activation: Vec::new(),
+            neuron_derivative: Vec::new(),        
             max_neuron_index: 0,
             index: 0,
         }
@@ -31,10 +31,12 @@ impl Tracer {
 
 
     /// reset the tracer. The backprop works off of indexed values so when the
-    /// layer is reset, the tracer must be reset as well
+    /// layer is reset, the tracer must be reset as well. The histories are emptied 
+    /// instead of thrown away so the next batch can reuse their buffers
     pub fn reset(&mut self) {
-        self.neuron_activation = HashMap::new();
-        self.neuron_derivative = HashMap::new();
+        for states in self.neuron_activation.iter_mut().chain(self.neuron_derivative.iter_mut()) {
+            states.clear();
+        }
         self.index = 0;        
     }
 
@@ -42,19 +44,13 @@ impl Tracer {
 
     /// update a neuron and add it's activated value 𝜎(Σ(w * i) + b)
     pub fn update_neuron_activation(&mut self, neuron_id: &NeuronId, neuron_value: f32) {
-        if self.neuron_activation.contains_key(&neuron_id) {
-            let states = self.neuron_activation.get_mut(&neuron_id).unwrap();
-            states.push(neuron_value);
-
-            // keep track of how many values are being kept track of so the list's don't 
-            // have to resize after one iteration, speeds things up as time goes on 
-            if states.len() > self.max_neuron_index {
-                self.max_neuron_index += 1;
-            }
-        } else {
-            let mut temp = Vec::with_capacity(self.max_neuron_index);
-            temp.push(neuron_value);
-            self.neuron_activation.insert(*neuron_id, temp);
+        let states = Tracer::neuron_states(&mut self.neuron_activation, neuron_id, self.max_neuron_index);
+        states.push(neuron_value);
+
+        // keep track of how many values are being kept track of so the list's don't 
+        // have to resize after one iteration, speeds things up as time goes on 
+        if states.len() > self.max_neuron_index {
+            self.max_neuron_index += 1;
         }
     }
 
@@ -62,34 +58,39 @@ impl Tracer {
 
     /// update a neuron and add it's derivative of it's activated value to the tracer
     pub fn update_neuron_derivative(&mut self, neuron_id: &NeuronId, neuron_d: f32) {
-        if self.neuron_derivative.contains_key(&neuron_id) {
-            let states = self.neuron_derivative.get_mut(&neuron_id).unwrap();
-            states.push(neuron_d);
-        } else {
-            let mut temp = Vec::with_capacity(self.max_neuron_index);
-            temp.push(neuron_d);
-            self.neuron_derivative.insert(*neuron_id, temp);
-        }
+        Tracer::neuron_states(&mut self.neuron_derivative, neuron_id, self.max_neuron_index).push(neuron_d);
     }
 
 
 
     /// return the activated value of a neuron at the current index 
     pub fn neuron_activation(&self, neuron_id: NeuronId) -> f32 {
-        if !self.neuron_activation.contains_key(&neuron_id) {
-            panic!("Tracer neuron state doesn't contain uuid: {:?}", neuron_id);
+        match self.neuron_activation.get(neuron_id.index()) {
+            Some(states) if !states.is_empty() => states[self.index - 1],
+            _ => panic!("Tracer neuron state doesn't contain neuron: {:?}", neuron_id)
         }
-        self.neuron_activation.get(&neuron_id).unwrap()[self.index - 1]
     }
 
 
 
     /// return the derivative of a neuron at the current index 
     pub fn neuron_derivative(&self, neuron_id: NeuronId) -> f32 {
-        if !self.neuron_derivative.contains_key(&neuron_id) {
-            panic!("Tracer neuron state doesn't contain uuid: {:?}", neuron_id);
+        match self.neuron_derivative.get(neuron_id.index()) {
+            Some(states) if !states.is_empty() => states[self.index - 1],
+            _ => panic!("Tracer neuron state doesn't contain neuron: {:?}", neuron_id)
+        }
+    }
+
+
+
+    /// get the history slot for a neuron, growing the table if this neuron hasn't been seen yet
+    #[inline]
+    fn neuron_states<'a>(table: &'a mut Vec<Vec<f32>>, neuron_id: &NeuronId, capacity: usize) -> &'a mut Vec<f32> {
+        let index = neuron_id.index();
+        if index >= table.len() {
+            table.resize_with(index + 1, || Vec::with_capacity(capacity));
         }
-        self.neuron_derivative.get(&neuron_id).unwrap()[self.index - 1]
+        &mut table[index]
     }
 
 
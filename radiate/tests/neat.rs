@@ -53,6 +53,34 @@ fn test_create_neat() {
   println!("outputs = {:?}", outputs);
 }
 
+#[test]
+fn test_neat_eq() {
+  let neat = create_neat(10, 5, 2, true);
+  assert!(neat == neat);
+  assert!(neat == neat.clone());
+
+  // every edge gets its own innovation number, so two networks built the same way still differ
+  assert!(neat != create_neat(10, 5, 2, true));
+  assert!(neat != create_neat(10, 6, 2, true));
+  assert!(neat != create_neat(10, 0, 2, true));
+
+  let recurrent = Neat::new()
+      .input_size(10)
+      .lstm(5, 2, Activation::Tanh)
+      .gru(5, 2, Activation::Tanh);
+  assert!(recurrent == recurrent.clone());
+  assert!(recurrent != Neat::new()
+      .input_size(10)
+      .lstm(5, 2, Activation::Tanh)
+      .gru(5, 2, Activation::Tanh));
+
+  let lstm = LSTM::new(10, 5, 2, Activation::Tanh);
+  let mut other = lstm.clone();
+  assert!(lstm == other);
+  other.activation = Activation::Sigmoid;
+  assert!(lstm != other);
+}
+
 #[bench]
 fn bench_neat_dense_pool(b: &mut Bencher) {
   const INPUT_SIZE: usize = 25;
@@ -92,18 +92,19 @@ impl Evtree {
         let mut curr_node = self.root_opt()
             .expect("No root node.");
         loop {
-            let node_output = curr_node.neural_network.feed_forward(inputs.clone());
-            let (mut max_index, mut temp_value) = (0, None);
-            for i in 0..node_output.len() {
-                if node_output[i] > node_output[max_index] || temp_value.is_none() {
-                    max_index = i;
-                    temp_value = Some(node_output[i]);
-                }
-            }
-
+            // a leaf's output is fixed, so only run the network when it picks the next node
             if curr_node.is_leaf() {
                 return curr_node.output;
             } else {
+                let node_output = curr_node.neural_network.feed_forward_ref(&inputs);
+                let (mut max_index, mut temp_value) = (0, None);
+                for i in 0..node_output.len() {
+                    if node_output[i] > node_output[max_index] || temp_value.is_none() {
+                        max_index = i;
+                        temp_value = Some(node_output[i]);
+                    }
+                }
+
                 let next_node = if max_index == 0 {
                     curr_node.left_child_opt().or_else(|| {
                         curr_node.right_child_opt()
@@ -1,7 +1,7 @@
 extern crate simple_matrix;
 
-use std::f32::consts::E as Eul;
 use rand::Rng;
+use rand::distributions::{Standard, Uniform};
 use rand::rngs::ThreadRng;
 use simple_matrix::Matrix;
 
@@ -57,15 +57,21 @@ impl NeuralNetwork {
     pub fn edit_weights(&mut self, weight_mutate: f32, weight_transform: f32, layer_mutate: f32) {
         // create a closure to apply to each the weights and the biases
         // which randomly transforms the given weight be a given weight transform amount 
-        // or uniformly changed.
-        // need to create a new rand thread_rng because during concurrent weight editing, there is a change
-        // the network's self random will try to generage both an f32 and an f32 at the same time
-        // resulting in a program wide panic! that unwinds the stack.
+        // or uniformly changed. The transform range can only be built ahead of time 
+        // when it isn't empty, otherwise leave it to gen_range like before
         let mut temp_rand = rand::thread_rng();
+        let perturb = if weight_transform > 0.0 {
+            Some(Uniform::new(-weight_transform, weight_transform))
+        } else {
+            None
+        };
         let transform = |x: &mut f32| {
             let mut r = rand::thread_rng();
             if r.gen::<f32>() < weight_mutate {
-                *x *= r.gen_range(-weight_transform, weight_transform);
+                *x *= match &perturb {
+                    Some(range) => r.sample(range),
+                    None => r.gen_range(-weight_transform, weight_transform)
+                };
             } else {
                 *x = r.gen::<f32>();
             }
@@ -129,28 +135,49 @@ impl NeuralNetwork {
     /// Note: the input matrix must already by transmuted to where the input rows 
     /// should equal the first layer's column -> dot product
     #[inline]
-    pub fn feed_forward(&self, mut input: Matrix<f32>) -> Matrix<f32> {
-        for (weight, bias) in self.weights.iter().zip(self.biases.iter()) {
-            let mut layer_output = &(weight * &input) + bias;
-            layer_output.apply_mut(|x| *x = NeuralNetwork::sigmoid(x));
-            input = layer_output;
+    pub fn feed_forward(&self, input: Matrix<f32>) -> Matrix<f32> {
+        self.feed_forward_ref(&input)
+    }
+
+
+
+    /// feed forward a borrowed matrix through the neural network. Only the first layer
+    /// reads the input, so there's no need to take (or clone) it to run the network
+    #[inline]
+    pub fn feed_forward_ref(&self, input: &Matrix<f32>) -> Matrix<f32> {
+        let mut layers = self.weights.iter().zip(self.biases.iter());
+        let mut output = match layers.next() {
+            Some((weight, bias)) => NeuralNetwork::layer_output(weight, bias, input),
+            None => return input.clone()
+        };
+        for (weight, bias) in layers {
+            output = NeuralNetwork::layer_output(weight, bias, &output);
         }
-        input
+        output
+    }
+
+
+
+    /// compute σ(weight * input + bias) for one layer of the network
+    #[inline]
+    fn layer_output(weight: &Matrix<f32>, bias: &Matrix<f32>, input: &Matrix<f32>) -> Matrix<f32> {
+        let mut layer_output = &(weight * input) + bias;
+        layer_output.apply_mut(|x| *x = NeuralNetwork::sigmoid(x));
+        layer_output
     }
 
 
 
     /// Create two lists with randomly generated f32 values represetnting the weights
-    /// and biases of the neural network. Return them in a tuple
+    /// and biases of the neural network. Return them in a tuple. The weights are pulled
+    /// straight off of the rng as one stream and the biases are all 1.0 to start
     #[inline]    
     fn rand_layer_nums(&mut self, rows: usize, cols: usize, r: &mut ThreadRng) -> (Vec<f32>, Vec<f32>) {
         (
-            (0..(rows * cols))
-                .map(|_| r.gen::<f32>())
-                .collect::<Vec<_>>(),
-            (0..rows)
-                .map(|_| 1.0)
-                .collect::<Vec<_>>()
+            r.sample_iter(Standard)
+                .take(rows * cols)
+                .collect::<Vec<f32>>(),
+            vec![1.0; rows]
         )
     }
 
@@ -172,7 +199,7 @@ impl NeuralNetwork {
     /// Sigmoid function for as an activation function for the nerual network between layers
     #[allow(dead_code)]
     fn sigmoid(x: &f32) -> f32 {
-        1.0 / (1.0 + Eul.powf(*x * -1.0))
+        1.0 / (1.0 + (-*x).exp())
     }
 
 
@@ -191,25 +218,3 @@ impl PartialEq for NeuralNetwork {
         self.weights == other.weights && self.biases == other.biases
     }
 }
-
-
-
-impl Drop for NeuralNetwork {
-    fn drop(&mut self) {}
-}
-
-
-
-// #[cfg(test)]
-// mod tests {
-//     use super::*;
-
-//     #[test]
-//     fn test_feed_forward() {
-//         let input = vec![1.0, 0.5, 0.7, 1.0];
-//         let input_matrix = Matrix::from_iter(input.len(), 1, input);
-//         let network = NeuralNetwork::new(4).fill_random();
-//         let output = network.feed_forward(input_matrix);
-//         assert!(output.to_vec().len() == 2, true);
-//     }
-// }
\ No newline at end of file
@@ -204,16 +204,19 @@ impl<T: Clone> Tree<T> {
         let mut r = rand::thread_rng();
         let height = self.height();
         let index = r.gen_range(0, self.len()) as usize;
-        let levels = self.level_order_iter()
+        // only the level of the randomly indexed node is needed, so walk to it
+        // instead of collecting the level of every node in the tree
+        let level = self.level_order_iter()
+            .nth(index)
             .map(|x: &Node<T>| height - x.height())
-            .collect::<Vec<_>>();
+            .expect("Biased level index outside of tree.");
 
         // return a vec where the depth of a node is equal to 
         // the biased level chosen. Order does not matter
         // because there will be more numbers in the levels vec with 
         // a lower depth inherintly due to tree structures
         self.in_order_iter()
-            .filter(|x| x.depth() == levels[index])
+            .filter(|x| x.depth() == level)
             .collect::<Vec<_>>()
     }
 